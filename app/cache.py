@@ -0,0 +1,37 @@
+"""
+In-process TTL cache for hot single-task reads.
+The short TTL bounds staleness in multi-worker deployments while letting
+repeated GETs for the same task skip the database entirely.
+"""
+
+from cachetools import TTLCache
+
+# Roughly one working set of hot tasks; entries expire after 5 seconds.
+task_cache = TTLCache(maxsize=10_000, ttl=5)
+
+def get(task_id: int):
+    """Returns the cached serialized task, or None on a miss."""
+    return task_cache.get(task_id)
+
+def put(task_id: int, data: dict):
+    """Stores a serialized task response under its id."""
+    task_cache[task_id] = data
+
+def invalidate(task_id: int):
+    """Drops a task from the cache after a write, if present."""
+    task_cache.pop(task_id, None)
+
+# Pre-serialized GET /tasks pages keyed by (filters, page, version), where
+# version is (count, max(updated_at)) over the filtered set — writes bump
+# the timestamp and membership changes move the count, so changed data is
+# keyed away rather than invalidated; the TTL bounds residual staleness
+# (e.g. cross-worker clock skew).
+list_cache = TTLCache(maxsize=1024, ttl=30)
+
+def get_list(key):
+    """Returns the cached serialized task page, or None on a miss."""
+    return list_cache.get(key)
+
+def put_list(key, body: bytes):
+    """Stores a serialized task page under its versioned key."""
+    list_cache[key] = body
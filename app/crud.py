@@ -1,86 +1,226 @@
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from . import models, schemas
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from . import models, schemas, cache
+
+async def _resolve_tags(db: AsyncSession, tag_names):
+    """
+    Resolves tag names to Tag objects with a fixed number of round-trips.
+    Existing tags are fetched with one IN query; missing names are created
+    with a single bulk INSERT ... ON CONFLICT DO NOTHING, which also keeps
+    concurrent writers from racing on the unique tags.name index.
+    Preserves the order of the input names.
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return []
+    result = await db.execute(select(models.Tag).filter(models.Tag.name.in_(names)))
+    by_name = {tag.name: tag for tag in result.scalars().all()}
+
+    missing = [name for name in names if name not in by_name]
+    if missing:
+        await db.execute(
+            pg_insert(models.Tag)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        # Re-select to pick up ids for both our inserts and any rows a
+        # concurrent writer won on.
+        result = await db.execute(select(models.Tag).filter(models.Tag.name.in_(missing)))
+        by_name.update({tag.name: tag for tag in result.scalars().all()})
+
+    return [by_name[name] for name in names]
 
 async def get_task(db: AsyncSession, task_id: int):
     """Fetches a task, ensuring tags are loaded and soft-deletes are respected."""
-    query = select(models.Task).options(selectinload(models.Task.tags)).filter(
-        models.Task.id == task_id, 
-        models.Task.is_deleted == False
+    # Session.get consults the identity map first, so a row already loaded
+    # in this request costs no SQL at all. raiseload('*') makes any
+    # unloaded-relationship access fail loudly instead of silently
+    # issuing hidden N+1 queries.
+    db_task = await db.get(
+        models.Task,
+        task_id,
+        options=[
+            selectinload(models.Task.tags),
+            raiseload("*"),
+        ],
     )
-    result = await db.execute(query)
-    return result.scalars().first()
+    if db_task is None or db_task.is_deleted:
+        return None
+    return db_task
 
-async def get_tasks(db: AsyncSession, skip: int = 0, limit: int = 10, completed: bool = None, priority: int = None, tags: str = None):
-    """Retrieves tasks with pagination and tag/priority filtering."""
-    query = select(models.Task).options(selectinload(models.Task.tags)).filter(models.Task.is_deleted == False)
-    
+def _apply_task_filters(query, completed=None, priority=None, tags=None):
+    """Applies the shared GET /tasks predicates to a select statement."""
+    # Compare status_bits against whole values rather than using the
+    # hybrid expressions: (status_bits & N) != 0 wraps the column in an
+    # operation, which the planner cannot match against the composite
+    # indexes leading with status_bits. With only two bits defined,
+    # not-deleted plus a known completed state pins the column to a
+    # single value, and not-deleted alone is a two-value IN — both
+    # sargable equality probes.
     if completed is not None:
-        query = query.filter(models.Task.completed == completed)
+        query = query.filter(
+            models.Task.status_bits == (models.COMPLETED_BIT if completed else 0)
+        )
+    else:
+        query = query.filter(models.Task.status_bits.in_((0, models.COMPLETED_BIT)))
+
     if priority is not None:
         query = query.filter(models.Task.priority == priority)
-    
+
     if tags:
-        tag_list = [t.strip() for t in tags.split(",")]
-        for tag_name in tag_list:
-            query = query.filter(models.Task.tags.any(models.Tag.name == tag_name))
-            
-    result = await db.execute(query.offset(skip).limit(limit))
+        # One join + GROUP BY/HAVING instead of a correlated EXISTS per tag,
+        # so the planner can use a single hash semi-join for any tag count.
+        # Kept as an id subquery so the aggregate does not interfere with
+        # the selectin eager load on the outer query.
+        tag_subq = (
+            select(models.Task.id)
+            .join(models.Task.tags)
+            .filter(models.Tag.name.in_(tags))
+            .group_by(models.Task.id)
+            .having(func.count(func.distinct(models.Tag.name)) == len(tags))
+        )
+        query = query.filter(models.Task.id.in_(tag_subq))
+
+    return query
+
+async def get_tasks_version(db: AsyncSession, completed: bool = None, priority: int = None, tags: list = None):
+    """
+    Returns (count, max(updated_at)) over the filtered set. Writes to a
+    matching task bump the timestamp, and rows entering or leaving the set
+    change the count, so together they version cached list responses —
+    including deletions of rows whose updated_at was not the max.
+    """
+    query = _apply_task_filters(
+        select(func.count(models.Task.id), func.max(models.Task.updated_at)),
+        completed, priority, tags,
+    )
+    result = await db.execute(query)
+    return result.one()
+
+async def get_tasks(db: AsyncSession, skip: int = 0, limit: int = 10, completed: bool = None, priority: int = None, tags: list = None):
+    """
+    Retrieves tasks with pagination and tag/priority filtering.
+    `tags` is a pre-parsed, deduplicated list of tag names (see
+    main.parse_tags); all listed tags must be present on a task.
+    """
+    # Phase 1: resolve just the ids of the requested page, so filtering and
+    # window trimming touch only the narrow id column on the DB side.
+    query = _apply_task_filters(select(models.Task.id), completed, priority, tags)
+
+    # Explicit ordering keeps pagination deterministic across both phases.
+    id_result = await db.execute(query.order_by(models.Task.id).offset(skip).limit(limit))
+    task_ids = id_result.scalars().all()
+    if not task_ids:
+        return []
+
+    # Phase 2: hydrate full rows (with tags) for exactly the page of ids.
+    result = await db.execute(
+        select(models.Task)
+        .options(selectinload(models.Task.tags), raiseload("*"))
+        .filter(models.Task.id.in_(task_ids))
+        .order_by(models.Task.id)
+    )
     return result.scalars().all()
 
 async def create_task(db: AsyncSession, task: schemas.TaskCreate):
     """Persists a new task and its associated tags."""
-    db_task = models.Task(
-        title=task.title,
-        description=task.description,
-        priority=task.priority,
-        due_date=task.due_date,
-        completed=task.completed
+    tag_objs = await _resolve_tags(db, task.tags or [])
+
+    values = task.model_dump(exclude={"tags", "completed"})
+    values["status_bits"] = models.COMPLETED_BIT if task.completed else 0
+
+    # Core INSERT ... RETURNING yields the id in the same round-trip,
+    # avoiding the unit-of-work flush plus follow-up SELECT for defaults.
+    result = await db.execute(
+        insert(models.Task).values(**values).returning(models.Task)
     )
-    
-    if task.tags:
-        for tag_name in task.tags:
-            tag_result = await db.execute(select(models.Tag).filter(models.Tag.name == tag_name))
-            tag = tag_result.scalars().first()
-            if not tag:
-                tag = models.Tag(name=tag_name)
-            db_task.tags.append(tag)
-            
-    db.add(db_task)
-    # Flush ensures IDs are generated before the final commit/refresh cycle
-    await db.flush() 
+    db_task = result.scalars().one()
+
+    if tag_objs:
+        # Association rows go in as one bulk INSERT rather than per-row
+        # cascade flushes.
+        await db.execute(
+            insert(models.task_tags),
+            [{"task_id": db_task.id, "tag_id": tag.id} for tag in tag_objs],
+        )
     await db.commit()
-    return await get_task(db, db_task.id)
+
+    # Mark the tags collection as loaded without dirtying it; the
+    # association rows are already persisted above.
+    set_committed_value(db_task, "tags", tag_objs)
+    return db_task
 
 async def update_task(db: AsyncSession, task_id: int, task_update: schemas.TaskUpdate):
     """Updates task fields and handles tag relationship refreshes."""
+    # Using model_dump to comply with Pydantic V2 standards
+    update_data = task_update.model_dump(exclude_unset=True)
+
+    if not update_data:
+        return await get_task(db, task_id)
+
+    if "tags" not in update_data:
+        # Scalar-only PATCH: one UPDATE ... RETURNING instead of loading
+        # the full task first. Tags are still fetched once for the response.
+        values = dict(update_data)
+        completed = values.pop("completed", None)
+        if completed is not None:
+            # completed is packed into status_bits, so flip the bit in SQL.
+            values["status_bits"] = (
+                models.Task.status_bits.op("|")(models.COMPLETED_BIT)
+                if completed
+                else models.Task.status_bits.op("&")(~models.COMPLETED_BIT)
+            )
+        result = await db.execute(
+            update(models.Task)
+            .where(models.Task.id == task_id, models.Task.is_deleted == False)
+            .values(**values)
+            .returning(models.Task)
+        )
+        db_task = result.scalars().first()
+        if db_task is None:
+            return None
+        # Tags are not part of the RETURNING row, so load them for the
+        # response.
+        await db.refresh(db_task, attribute_names=["tags"])
+        await db.commit()
+        cache.invalidate(task_id)
+        return db_task
+
     db_task = await get_task(db, task_id)
     if not db_task:
         return None
-    
-    # Using model_dump to comply with Pydantic V2 standards
-    update_data = task_update.model_dump(exclude_unset=True)
+
     for key, value in update_data.items():
         if key == "tags":
-            db_task.tags = []
-            for tag_name in value:
-                tag_result = await db.execute(select(models.Tag).filter(models.Tag.name == tag_name))
-                tag = tag_result.scalars().first()
-                if not tag:
-                    tag = models.Tag(name=tag_name)
-                db_task.tags.append(tag)
+            db_task.tags = await _resolve_tags(db, value)
+            # A tags-only PATCH writes no tasks column, so the onupdate
+            # hook would never fire; bump the version explicitly.
+            db_task.updated_at = models.utcnow()
         else:
             setattr(db_task, key, value)
-            
-    await db.flush()
+
     await db.commit()
-    return await get_task(db, task_id)
+    cache.invalidate(task_id)
+    # Tags were either untouched (still eagerly loaded) or replaced
+    # in-Python above, so the live object can be returned directly.
+    return db_task
 
-async def delete_task(db: AsyncSession, task_id: int):
-    """Performs a soft delete."""
-    db_task = await get_task(db, task_id)
-    if db_task:
-        db_task.is_deleted = True
-        await db.commit()
-    return db_task
\ No newline at end of file
+async def delete_task(db: AsyncSession, task_id: int) -> bool:
+    """
+    Performs a soft delete with a single UPDATE statement.
+    Returns True if a live task was deleted, False otherwise.
+    """
+    result = await db.execute(
+        update(models.Task)
+        .where(models.Task.id == task_id, models.Task.is_deleted == False)
+        .values(status_bits=models.Task.status_bits.op("|")(models.DELETED_BIT))
+        .returning(models.Task.id)
+    )
+    deleted = result.first() is not None
+    await db.commit()
+    cache.invalidate(task_id)
+    return deleted
\ No newline at end of file
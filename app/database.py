@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import sessionmaker
 import os
 
@@ -6,8 +7,23 @@ import os
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 # Initialize the Asynchronous SQL Engine
-# echo=True enables SQL logging for development transparency
-engine = create_async_engine(DATABASE_URL, echo=True)
+# SQL logging is opt-in via SQL_ECHO=1; leaving it on formats and prints
+# every statement, which is a significant per-query cost in production.
+# query_cache_size keeps compiled forms of the hot statements cached so
+# repeated get_task/get_tasks calls skip SQL compilation entirely.
+# Explicit pool sizing keeps connection acquisition a cheap pool pop under
+# concurrent load instead of a fresh TCP+auth round-trip per request burst.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO") == "1",
+    query_cache_size=1200,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
 
 # Create a session factory specifically for AsyncSessions
 # expire_on_commit=False prevents SQLAlchemy from re-fetching objects 
@@ -5,17 +5,22 @@ custom error handling, and task-related endpoints.
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
+from datetime import date
 from typing import List, Optional
 
 # Third-party imports
-from fastapi import FastAPI, Depends, HTTPException, Request, status
+import msgspec
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local module imports
-from . import models, schemas, crud, database
+from . import models, schemas, fast_schemas, crud, cache, database
 
 # Setup basic logging for production visibility
 logging.basicConfig(level=logging.INFO)
@@ -25,34 +30,47 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """
     Handles application startup and shutdown.
-    Creates database tables automatically on startup using SQLAlchemy's 
-    asynchronous metadata.
+    Table creation is opt-in via AUTO_CREATE_TABLES=1 (development only);
+    create_all reflects every table on boot, which slows cold starts and
+    serializes multi-worker rollouts. Production schemas are managed
+    with Alembic migrations.
     """
-    logger.info("Starting up: Initializing database tables...")
-    async with database.engine.begin() as conn:
-        await conn.run_sync(models.Base.metadata.create_all)
+    if os.getenv("AUTO_CREATE_TABLES") == "1":
+        logger.info("Starting up: Initializing database tables...")
+        async with database.engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
     yield
     logger.info("Shutting down application...")
 
 # Initialize the core FastAPI application
+# ORJSONResponse serializes several times faster than stdlib json and
+# handles date/datetime natively, which matters for the nested TaskResponse.
 app = FastAPI(
-    title="MediVue Task API", 
+    title="MediVue Task API",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+@app.middleware("http")
+async def memoize_request_date(request: Request, call_next):
+    """Resolves today's date once per request for the due-date validators."""
+    schemas.TODAY.set(date.today())
+    return await call_next(request)
+
 # CUSTOM EXCEPTION HANDLER
 # Overrides the default FastAPI validation error to match the required format:
 # { "error": "Validation Failed", "details": { "field": "message" } }
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    # Only the field name and message reach the response.
     details = {}
     for error in exc.errors():
-        field = str(error["loc"][-1])
-        message = error["msg"]
-        details[field] = message
+        field = error["loc"][-1] if error["loc"] else "body"
+        # loc entries are already strings except for list indices
+        details[field if isinstance(field, str) else str(field)] = error["msg"]
 
-    return JSONResponse(
+    return ORJSONResponse(
         # Updated constant to silence deprecation warning
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         content={
@@ -61,54 +79,152 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
+def parse_tags(tags: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Dependency that parses the comma-separated `tags` query parameter once,
+    stripping whitespace and deduplicating while preserving order.
+    Returns None when no usable tag names remain.
+    """
+    if not tags:
+        return None
+    return [t for t in dict.fromkeys(s.strip() for s in tags.split(",")) if t] or None
+
 # API ENDPOINTS
+# Endpoints return ORJSONResponse directly with payloads built by
+# TaskResponse.from_orm_fast: rows coming out of the database are trusted,
+# so re-running the validator pipeline on every response is skipped.
+# response_model stays on the decorators purely for the OpenAPI docs.
 
-@app.post("/tasks", response_model=schemas.TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(task: schemas.TaskCreate, db: AsyncSession = Depends(database.get_db)):
+@app.post(
+    "/tasks",
+    response_model=schemas.TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+    # Body documentation comes from the Pydantic schema even though the
+    # request itself is decoded with msgspec below.
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schemas.TaskCreate.model_json_schema()}},
+        }
+    },
+)
+async def create_task(request: Request, db: AsyncSession = Depends(database.get_db)):
     """
     Creates a new task.
     Supports Many-to-Many tagging logic during creation.
+    The body is decoded with msgspec (several times faster than the
+    Pydantic pipeline); write-side rules are applied as explicit checks.
     """
-    return await crud.create_task(db=db, task=task)
+    try:
+        task_ms = fast_schemas.TASK_CREATE_DECODER.decode(await request.body())
+    except msgspec.ValidationError as exc:
+        # Type/requiredness failures are keyed by field, matching the
+        # error shape of the Pydantic pipeline.
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            content={"error": "Validation Failed", "details": fast_schemas.validation_error_details(exc)},
+        )
+    except msgspec.DecodeError as exc:
+        # Malformed JSON has no field to blame.
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            content={"error": "Validation Failed", "details": {"body": str(exc)}},
+        )
+
+    errors = fast_schemas.validate_task_create(task_ms)
+    if errors:
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            content={"error": "Validation Failed", "details": errors},
+        )
+
+    task = schemas.TaskCreate.model_construct(**msgspec.structs.asdict(task_ms))
+    db_task = await crud.create_task(db=db, task=task)
+    return ORJSONResponse(
+        schemas.TaskResponse.from_orm_fast(db_task).model_dump(),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 @app.get("/tasks", response_model=List[schemas.TaskResponse])
 async def read_tasks(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
     completed: Optional[bool] = None,
     priority: Optional[int] = None,
-    tags: Optional[str] = None,
+    tags: Optional[List[str]] = Depends(parse_tags),
     db: AsyncSession = Depends(database.get_db)
 ):
     """
     Retrieves a list of tasks with pagination.
     Filtering: Completion status, Priority level, and Tag name.
+    Responses carry an ETag derived from (count, max(updated_at)) over
+    the filtered set, and serialized pages are cached under that version
+    so unchanged data costs one aggregate query instead of SQL + encoding.
     """
-    return await crud.get_tasks(
-        db, skip=skip, limit=limit, completed=completed, priority=priority, tags=tags
-    )
+    count, latest = await crud.get_tasks_version(db, completed=completed, priority=priority, tags=tags)
+    etag = f'W/"{count}-{latest.isoformat()}"' if latest else f'W/"{count}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    key = (skip, limit, completed, priority, tuple(tags) if tags else None, count, latest)
+    body = cache.get_list(key)
+    if body is None:
+        db_tasks = await crud.get_tasks(
+            db, skip=skip, limit=limit, completed=completed, priority=priority, tags=tags
+        )
+        # One dump call for the whole page via the module-level adapter.
+        body = orjson.dumps(
+            schemas.TASK_LIST_ADAPTER.dump_python(
+                [schemas.TaskResponse.from_orm_fast(t) for t in db_tasks]
+            )
+        )
+        cache.put_list(key, body)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @app.get("/tasks/{task_id}", response_model=schemas.TaskResponse)
 async def read_task(task_id: int, db: AsyncSession = Depends(database.get_db)):
     """
     Fetches a specific task by its primary key ID.
+    Served from a short-lived in-process cache when possible.
     Raises 404 if the task is deleted or does not exist.
     """
+    cached = cache.get(task_id)
+    if cached is not None:
+        return ORJSONResponse(cached)
     db_task = await crud.get_task(db, task_id=task_id)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return db_task
+    payload = schemas.TaskResponse.from_orm_fast(db_task).model_dump()
+    cache.put(task_id, payload)
+    return ORJSONResponse(payload)
 
-@app.patch("/tasks/{task_id}", response_model=schemas.TaskResponse)
-async def update_task(task_id: int, task: schemas.TaskUpdate, db: AsyncSession = Depends(database.get_db)):
+@app.patch(
+    "/tasks/{task_id}",
+    response_model=schemas.TaskResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schemas.TaskUpdate.model_json_schema()}},
+        }
+    },
+)
+async def update_task(task_id: int, request: Request, db: AsyncSession = Depends(database.get_db)):
     """
     Performs a partial update on a task record.
     Only fields provided in the request body will be modified.
+    The raw body bytes go straight into the cached TypeAdapter's
+    validate_json, so pydantic-core parses the JSON in Rust with no
+    intermediate Python dict.
     """
+    try:
+        task = schemas.update_adapter().validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
     db_task = await crud.update_task(db, task_id=task_id, task_update=task)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return db_task
+    return ORJSONResponse(schemas.TaskResponse.from_orm_fast(db_task).model_dump())
 
 @app.delete("/tasks/{task_id}")
 async def delete_task(task_id: int, db: AsyncSession = Depends(database.get_db)):
@@ -116,7 +232,7 @@ async def delete_task(task_id: int, db: AsyncSession = Depends(database.get_db))
     Performs a Soft Delete by setting the is_deleted flag to True.
     Data remains in the database for audit purposes but is removed from active API views.
     """
-    db_task = await crud.delete_task(db, task_id=task_id)
-    if db_task is None:
+    deleted = await crud.delete_task(db, task_id=task_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="Task not found")
     return {"detail": "Task deleted successfully"}
@@ -3,11 +3,48 @@ SQLAlchemy models defining the database schema.
 Implements Many-to-Many relationships and Soft Delete strategies.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table, Date
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, SmallInteger, String, ForeignKey, Index, Table, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Bit layout of Task.status_bits
+COMPLETED_BIT = 1
+DELETED_BIT = 2
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp with microsecond precision.
+    Used for updated_at so list-response versions change even for writes
+    landing within the same second (server-side now() is second-resolution
+    on some backends)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class DateAsInt(TypeDecorator):
+    """
+    Stores dates as 4-byte integers (days since 1970-01-01).
+    Integer index leaves are half the size of DATE storage and range
+    comparisons are plain integer compares; the Python side of the
+    boundary still speaks datetime.date.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return value.toordinal() - _EPOCH_ORDINAL
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return date.fromordinal(value + _EPOCH_ORDINAL)
+
 # Association Table
 # Facilitates the Many-to-Many relationship between Tasks and Tags.
 task_tags = Table(
@@ -15,15 +52,26 @@ task_tags = Table(
     Base.metadata,
     Column("task_id", Integer, ForeignKey("tasks.id"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
+    # The composite PK covers Task->Tag lookups; this covers the reverse
+    # Tag->Task direction used by the tag filter in get_tasks.
+    Index("ix_task_tags_tag_task", "tag_id", "task_id"),
 )
 
 class Tag(Base):
     """Model representing a task category or tag."""
     __tablename__ = "tags"
-    
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
 
+    # lazy="raise" because nothing reads Tag->Task today; any future access
+    # must opt into an explicit eager load rather than lazy-loading N+1.
+    # viewonly: nothing writes this side either, so the unit of work can
+    # skip keeping it coherent on every Task.tags mutation.
+    tasks = relationship(
+        "Task", secondary=task_tags, back_populates="tags", viewonly=True, lazy="raise"
+    )
+
 class Task(Base):
     """
     Model representing a work task. 
@@ -31,17 +79,65 @@ class Task(Base):
     """
     __tablename__ = "tasks"
 
+    # Composite indexes matching the frequent GET /tasks filter shapes,
+    # so the paginated list query is served by a single range scan.
+    __table_args__ = (
+        Index("ix_tasks_active_filter", "status_bits", "priority", "due_date"),
+        Index("ix_tasks_active_due", "status_bits", "due_date"),
+        Index("ix_tasks_due_date", "due_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(String, nullable=True)
     priority = Column(Integer, nullable=False) # Range validation (1-5) enforced in Pydantic
-    due_date = Column(Date, nullable=False)
-    
-    # Indexed for efficient filtering in GET requests
-    completed = Column(Boolean, default=False, index=True) 
+    due_date = Column(DateAsInt, nullable=False)
     
-    # Soft Delete flag for data integrity and recovery
-    is_deleted = Column(Boolean, default=False, index=True) 
+    # Completion and soft-delete flags packed into one small integer, so
+    # the common "active" predicates are single-column probes and only one
+    # index column needs maintaining. Bit 0 = completed, bit 1 = deleted.
+    status_bits = Column(SmallInteger, nullable=False, default=0)
+
+    # Bumped on every write; combined with count(*) it versions the
+    # list-response cache and ETags.
+    updated_at = Column(
+        DateTime, nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now()
+    )
+
+    # The `or 0` guards cover transient instances: the column default only
+    # applies at INSERT time, so status_bits is None on a freshly
+    # constructed Task(...) until it is flushed.
+    @hybrid_property
+    def completed(self):
+        return bool((self.status_bits or 0) & COMPLETED_BIT)
+
+    @completed.setter
+    def completed(self, value):
+        if value:
+            self.status_bits = (self.status_bits or 0) | COMPLETED_BIT
+        else:
+            self.status_bits = (self.status_bits or 0) & ~COMPLETED_BIT
+
+    @completed.expression
+    def completed(cls):
+        return cls.status_bits.op("&")(COMPLETED_BIT) != 0
+
+    @hybrid_property
+    def is_deleted(self):
+        return bool((self.status_bits or 0) & DELETED_BIT)
+
+    @is_deleted.setter
+    def is_deleted(self, value):
+        if value:
+            self.status_bits = (self.status_bits or 0) | DELETED_BIT
+        else:
+            self.status_bits = (self.status_bits or 0) & ~DELETED_BIT
+
+    @is_deleted.expression
+    def is_deleted(cls):
+        return cls.status_bits.op("&")(DELETED_BIT) != 0
     
     # Relationships
-    tags = relationship("Tag", secondary=task_tags, backref="tasks")
+    # selectin keeps tag loading to one IN-query per batch of tasks even
+    # when a query site forgets the explicit selectinload option.
+    tags = relationship("Tag", secondary=task_tags, back_populates="tasks", lazy="selectin")
@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration.
+Pins the anyio backend to asyncio on uvloop, which cuts the per-request
+scheduling overhead of the ASGI round-trips the suite is made of, and
+provides a per-worker prefix so the suite stays safe under pytest-xdist.
+"""
+
+import os
+
+import pytest
+
+# Module scope matches the module-scoped client fixture in test_main.py.
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return ("asyncio", {"use_uvloop": True})
+
+@pytest.fixture(scope="session")
+def worker_prefix():
+    """
+    Unique prefix for data created by this test process. All workers under
+    `pytest -n auto` share one database, so titles and tag names are
+    namespaced per worker to keep tests from seeing each other's rows.
+    Serial runs get a stable "main" prefix.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
@@ -10,6 +10,9 @@ from app.main import app
 
 BASE_URL = "http://test"
 
+# One module-level mark instead of a per-test decorator.
+pytestmark = pytest.mark.anyio
+
 @pytest.fixture(scope="module")
 async def client():
     """
@@ -19,19 +22,17 @@ async def client():
     async with AsyncClient(transport=ASGITransport(app=app), base_url=BASE_URL) as ac:
         yield ac
 
-@pytest.mark.anyio
-async def test_create_task_success(client):
+async def test_create_task_success(client, worker_prefix):
     """Scenario: Successfully create a task with tags."""
     response = await client.post("/tasks", json={
-        "title": "Integration Test Task",
+        "title": f"{worker_prefix} Integration Test Task",
         "priority": 3,
         "due_date": "2030-01-01",
-        "tags": ["testing", "async"]
+        "tags": [f"{worker_prefix}-testing", f"{worker_prefix}-async"]
     })
     assert response.status_code == 201
-    assert response.json()["title"] == "Integration Test Task"
+    assert response.json()["title"] == f"{worker_prefix} Integration Test Task"
 
-@pytest.mark.anyio
 async def test_create_task_validation_error(client):
     """Scenario: Ensure custom validation error shape is returned."""
     response = await client.post("/tasks", json={
@@ -43,7 +44,6 @@ async def test_create_task_validation_error(client):
     # Verify the custom error handler is working
     assert response.json()["error"] == "Validation Failed"
 
-@pytest.mark.anyio
 async def test_filter_tasks_by_priority(client):
     """Scenario: Verify GET filtering logic."""
     await client.post("/tasks", json={
@@ -56,15 +56,50 @@ async def test_filter_tasks_by_priority(client):
     tasks = response.json()
     assert all(t["priority"] == 5 for t in tasks)
 
-@pytest.mark.anyio
 async def test_partial_update_patch(client):
     """Scenario: Verify partial updates (PATCH) work as expected."""
     create = await client.post("/tasks", json={
-        "title": "Old Title", 
-        "priority": 1, 
+        "title": "Old Title",
+        "priority": 1,
         "due_date": "2030-01-01"
     })
     task_id = create.json()["id"]
     response = await client.patch(f"/tasks/{task_id}", json={"title": "New Title"})
     assert response.status_code == 200
-    assert response.json()["title"] == "New Title"
\ No newline at end of file
+    assert response.json()["title"] == "New Title"
+
+async def test_list_etag_invalidation(client, worker_prefix):
+    """Scenario: Verify the ETag/304 contract on the list endpoint."""
+    # Filtering on a worker-unique tag keeps other workers' writes from
+    # moving this ETag mid-test under pytest -n auto.
+    filter_tag = f"{worker_prefix}-etag-filter"
+    create = await client.post("/tasks", json={
+        "title": f"{worker_prefix} ETag Task",
+        "priority": 2,
+        "due_date": "2030-01-01",
+        "tags": [filter_tag, f"{worker_prefix}-etag-old"]
+    })
+    task_id = create.json()["id"]
+    params = {"tags": filter_tag}
+
+    first = await client.get("/tasks", params=params)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    # Unchanged data short-circuits to 304
+    unchanged = await client.get("/tasks", params=params, headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    # A tags-only PATCH must produce a new version and fresh tag data
+    await client.patch(f"/tasks/{task_id}", json={"tags": [filter_tag, f"{worker_prefix}-etag-new"]})
+    refreshed = await client.get("/tasks", params=params, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    task = next(t for t in refreshed.json() if t["id"] == task_id)
+    # Compared as a set: the tags relationship makes no ordering promise.
+    assert {t["name"] for t in task["tags"]} == {filter_tag, f"{worker_prefix}-etag-new"}
+
+    # A deletion must produce a new version and drop the row from the page
+    etag = refreshed.headers["etag"]
+    await client.delete(f"/tasks/{task_id}")
+    after_delete = await client.get("/tasks", params=params, headers={"If-None-Match": etag})
+    assert after_delete.status_code == 200
+    assert task_id not in [t["id"] for t in after_delete.json()]
\ No newline at end of file